@@ -5,28 +5,32 @@ from setup                                  import LOGGER, SUPABASE_KEY, SUPABAS
 from scraper_engine.api_requester           import APIRequester
 from scraper_engine.idx_suspension_scraper  import run_get_idx_suspension
 
-import pandas as pd 
+import pandas as pd
 import argparse
 
 
-def get_company_profile_symbol(supabase_client: create_client) -> list[str]:
+# Maximum number of rows sent per upsert request
+UPSERT_BATCH_SIZE = 1000
+
+
+def get_company_profile_symbol(supabase_client: create_client) -> frozenset[str]:
     """
-    Fetches the list of allowed symbols from the company profile table in Supabase.
-    
+    Fetches the set of allowed symbols from the company profile table in Supabase.
+
     Args:
         supabase_client (create_client): The Supabase client instance.
-    
+
     Returns:
-        list[str]: A list of allowed symbols.
+        frozenset[str]: The allowed symbols, as a frozenset for O(1) membership checks.
     """
     try:
-        allowed_symbols = [data_symbol.get('symbol') for data_symbol in
-                                supabase_client.from_("idx_company_profile").select("symbol").execute().data]
+        allowed_symbols = frozenset(data_symbol.get('symbol') for data_symbol in
+                                supabase_client.from_("idx_company_profile").select("symbol").execute().data)
 
         return allowed_symbols
     except Exception as error:
-        LOGGER.error(f"Error fetching company profile: {error}")
-        return {}
+        LOGGER.error("Error fetching company profile: %s", error)
+        return frozenset()
 
 
 def upsert_to_db(df_payload: pd.DataFrame | list[dict[str]], supabase_client: create_client):
@@ -47,25 +51,43 @@ def upsert_to_db(df_payload: pd.DataFrame | list[dict[str]], supabase_client: cr
             return
         
         payload_list = df_payload.to_dict(orient="records")
-        
-        LOGGER.info(f"Check payload to upsert: \n{payload_list}")
-
-        response = (
-            supabase_client
-            .table("idx_suspension")
-            .upsert(
-                payload_list, 
-                on_conflict='symbol,suspension_date'
-            )
-            .execute()
-        )
-
-        if hasattr(response, 'data') and response.data is not None:
-            LOGGER.info(f"Successfully upserted {len(payload_list)} records to database")
-        
-        else:
-            LOGGER.error(f"Upsert returned unexpected response: {response}")
-            raise RuntimeError(f"Upsert failed with response: {response}")
+
+        LOGGER.debug("Check payload to upsert: \n%s", payload_list)
+
+        upserted_count = 0
+        failed_batches = 0
+
+        # Upsert in fixed-size batches to stay within request limits
+        for start in range(0, len(payload_list), UPSERT_BATCH_SIZE):
+            batch = payload_list[start:start + UPSERT_BATCH_SIZE]
+
+            try:
+                response = (
+                    supabase_client
+                    .table("idx_suspension")
+                    .upsert(
+                        batch,
+                        on_conflict='symbol,suspension_date'
+                    )
+                    .execute()
+                )
+
+                if hasattr(response, 'data') and response.data is not None:
+                    upserted_count += len(batch)
+                    LOGGER.info("Upserted batch of %s records (%s/%s)", len(batch), upserted_count, len(payload_list))
+
+                else:
+                    LOGGER.error("Upsert returned unexpected response: %s", response)
+                    failed_batches += 1
+
+            except Exception as error:
+                LOGGER.error("Error upserting batch starting at row %s: %s", start, error)
+                failed_batches += 1
+
+        LOGGER.info("Successfully upserted %s records to database", upserted_count)
+
+        if failed_batches:
+            raise RuntimeError(f"Upsert failed for {failed_batches} batch(es)")
 
     except Exception as error:
         raise Exception(f"Error upserting to database: {error}")
@@ -82,7 +104,7 @@ if __name__ == '__main__':
 
     args = parser.parse_args()
     
-    LOGGER.info(f'Running start date: {args.start_date} | end date: {args.end_date}')
+    LOGGER.info('Running start date: %s | end date: %s', args.start_date, args.end_date)
     requester = APIRequester(start_date=args.start_date, end_date=args.end_date)
     
     supabase_client = create_client(SUPABASE_URL, SUPABASE_KEY)
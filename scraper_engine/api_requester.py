@@ -1,13 +1,32 @@
-from io         import BytesIO
-from bs4        import BeautifulSoup
+from bs4               import BeautifulSoup
+from urllib3.util.retry import Retry
+from requests.adapters import HTTPAdapter
 
 from setup import PROXY, LOGGER
 
-import pandas as pd 
-import ssl
-import urllib.request 
-import fitz 
-import time
+import requests
+import urllib3
+import asyncio
+import aiohttp
+import hashlib
+import glob
+import os
+
+
+# Maximum number of PDF downloads in flight at the same time
+MAX_CONCURRENT_DOWNLOADS = 10
+
+# Bounded retry for transient pdf download failures in the async path
+PDF_FETCH_RETRIES = 3
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+# On-disk cache for downloaded pdfs, keyed by URL hash
+CACHE_DIR = "cache"
+# Oldest cached pdfs are evicted beyond this count
+MAX_CACHE_FILES = 500
+
+# IDX endpoints are fetched with certificate verification disabled
+urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 
 class APIRequester:
@@ -18,64 +37,186 @@ class APIRequester:
         Args:
             proxy (str, optional): the proxy to be used. Defaults to None. Example: 'brd-customer-xxx-zone-xxx:xxx@brd.superproxy.io:xxx'
         """
-        # Set up SSL context to unverified
-        ssl._create_default_https_context = ssl._create_unverified_context
+        # Reuse one session so keep-alive sockets are shared across all IDX requests
+        self.session = requests.Session()
+        self.session.proxies = {'http': proxy, 'https': proxy}
+        self.session.verify = False
+
+        # aiohttp requires an explicit scheme, the documented proxy format has none
+        self.proxy = proxy if not proxy or '://' in proxy else f'http://{proxy}'
+
+        # Retry transient IDX errors with backoff at the connection-pool level
+        retry = Retry(
+            total=5,
+            backoff_factor=2,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods={'GET'}
+        )
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
 
-        proxy_support = urllib.request.ProxyHandler({'http': proxy,'https': proxy})
-        opener = urllib.request.build_opener(proxy_support)
-        urllib.request.install_opener(opener)
-        
         # Setup api url
         self.root_url ='https://www.idx.co.id'
         self.api_url = f"https://www.idx.co.id/primary/NewsAnnouncement/GetSuspension?indexFrom=1&dateFrom={start_date}&dateTo={end_date}&pageSize=9999&lang=en&type=spt"
         self.api_url_suspend_more_six_month = "https://www.idx.co.id/id/perusahaan-tercatat/suspensi-6-bulan/"
 
-    def fetch_url(self, url: str) -> str | bool:
+    def fetch_url(self, url: str) -> bytes | bool:
         """
-        Fetches the content of a URL using the installed opener.
-        
+        Fetches the content of a URL using the shared session.
+
         Args:
             url (str): The URL to fetch.
 
         Returns:
-            str | bool: The decoded content of the URL as a string if successful,
-                        False if an error occurs during fetching.
+            bytes | bool: The raw content of the URL if successful,
+                          False if an error occurs during fetching.
         """
-        # Use the installed opener to fetch the URL
+        # Return raw bytes, the JSON parser downstream accepts them directly
         try:
-            with urllib.request.urlopen(url if url else self.api_url) as response:
-                return response.read().decode()
+            response = self.session.get(url if url else self.api_url, timeout=30)
+            response.raise_for_status()
+            return response.content
         except Exception as error:
             print(f"Error fetching URL: {error}")
             return False
     
-    def fetch_pdf_file(self, pdf_url: str) -> fitz.Document:
-        """ 
-        Fetches a PDF file from the given URL and returns it as a fitz.Document object.
+    def _cached_pdf_path(self, pdf_url: str) -> str:
+        """
+        Builds the cache file path for a pdf URL.
+
+        Args:
+            pdf_url (str): The URL of the PDF file.
+
+        Returns:
+            str: The path of the cache file for this URL.
+        """
+        key = hashlib.sha1(pdf_url.encode()).hexdigest()
+        return os.path.join(CACHE_DIR, f"{key}.pdf")
+
+    def read_cached_pdf(self, pdf_url: str) -> bytes | None:
+        """
+        Reads a previously downloaded pdf from the on-disk cache.
+
+        Args:
+            pdf_url (str): The URL of the PDF file.
+
+        Returns:
+            bytes | None: The cached pdf content, or None on a cache miss.
+        """
+        cache_path = self._cached_pdf_path(pdf_url)
+        if os.path.exists(cache_path):
+            try:
+                with open(cache_path, 'rb') as cache_file:
+                    return cache_file.read()
+            except OSError as error:
+                LOGGER.warning("Could not read cached pdf %s: %s", cache_path, error)
+        return None
+
+    def write_cached_pdf(self, pdf_url: str, file_content: bytes):
+        """
+        Stores a downloaded pdf in the on-disk cache, evicting the oldest
+        entries once the cache grows past MAX_CACHE_FILES.
+
+        Args:
+            pdf_url (str): The URL of the PDF file.
+            file_content (bytes): The raw content of the PDF file.
+        """
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            cache_path = self._cached_pdf_path(pdf_url)
+
+            # Write atomically so a failed run never leaves a partial pdf
+            tmp_path = cache_path + '.tmp'
+            with open(tmp_path, 'wb') as cache_file:
+                cache_file.write(file_content)
+            os.replace(tmp_path, cache_path)
+
+            # Evict oldest entries beyond the cache bound
+            cached_files = sorted(glob.glob(os.path.join(CACHE_DIR, "*.pdf")), key=os.path.getmtime)
+            for old_path in cached_files[:-MAX_CACHE_FILES]:
+                os.remove(old_path)
+
+        except OSError as error:
+            LOGGER.warning("Could not cache pdf %s: %s", pdf_url, error)
+
+    async def fetch_pdf_bytes(self, session: aiohttp.ClientSession,
+                              semaphore: asyncio.Semaphore, pdf_url: str) -> bytes | None:
+        """
+        Fetches the raw bytes of a PDF file from the given URL using an aiohttp session.
 
         Args:
+            session (aiohttp.ClientSession): The shared aiohttp session to use.
+            semaphore (asyncio.Semaphore): Semaphore bounding the number of concurrent downloads.
             pdf_url (str): The URL of the PDF file to fetch.
-        
+
         Returns:
-            fitz.Document: The PDF document object containing the content of the PDF file.
+            bytes | None: The raw content of the PDF file, or None if the download fails.
         """
-        pdf_url = pdf_url.strip()
-        full_url = self.root_url + pdf_url
+        full_url = pdf_url
 
         try:
-            with urllib.request.urlopen(full_url) as response:
-                file_content = response.read()
-        
-            pdf_text = fitz.open(stream=file_content, filetype="pdf")
-            return pdf_text
+            if not pdf_url:
+                LOGGER.warning("Skipping pdf download, missing download URL")
+                return None
 
-        except fitz.FileDataError as e:
-            print(f"PDF corruption/format error for URL {full_url}: {str(e)}")
-            raise
-        
-        except Exception as e:
-            print(f"Unexpected error processing URL {full_url}: {type(e).__name__}: {str(e)}")
-            raise
+            full_url = self.root_url + pdf_url.strip()
+
+            # Serve previously downloaded pdfs from the on-disk cache
+            file_content = self.read_cached_pdf(full_url)
+            if file_content is not None:
+                return file_content
+
+            for attempt in range(PDF_FETCH_RETRIES):
+                try:
+                    async with semaphore:
+                        async with session.get(full_url, proxy=self.proxy) as response:
+                            response.raise_for_status()
+                            file_content = await response.read()
+
+                    self.write_cached_pdf(full_url, file_content)
+                    return file_content
+
+                except aiohttp.ClientResponseError as error:
+                    # Client errors other than the transient ones will not change on retry
+                    if error.status not in RETRYABLE_STATUS_CODES:
+                        raise
+                    LOGGER.warning("Attempt %s failed for pdf %s: %s", attempt + 1, full_url, error)
+                except (aiohttp.ClientError, asyncio.TimeoutError) as error:
+                    LOGGER.warning("Attempt %s failed for pdf %s: %s", attempt + 1, full_url, error)
+
+                if attempt < PDF_FETCH_RETRIES - 1:
+                    # Exponential backoff
+                    wait_time = (attempt + 1) * 2
+                    await asyncio.sleep(wait_time)
+
+            LOGGER.error("All %s attempts failed for pdf %s", PDF_FETCH_RETRIES, full_url)
+            return None
+
+        except Exception as error:
+            LOGGER.error("Error downloading PDF %s: %s: %s", full_url, type(error).__name__, error)
+            return None
+
+    def fetch_all_pdf_bytes(self, pdf_urls: list[str]) -> list[bytes | None]:
+        """
+        Downloads multiple PDF files concurrently and returns their raw bytes.
+
+        Args:
+            pdf_urls (list[str]): The URLs of the PDF files to fetch.
+
+        Returns:
+            list[bytes | None]: The raw content of each PDF in the same order as pdf_urls,
+                                with None for downloads that failed.
+        """
+        async def _run():
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+            connector = aiohttp.TCPConnector(limit=MAX_CONCURRENT_DOWNLOADS, ssl=False)
+
+            async with aiohttp.ClientSession(connector=connector) as session:
+                tasks = [self.fetch_pdf_bytes(session, semaphore, pdf_url) for pdf_url in pdf_urls]
+                return await asyncio.gather(*tasks)
+
+        return asyncio.run(_run())
 
     def get_xlsx_url_proxy(self) -> str | None:
         """ 
@@ -88,65 +229,44 @@ class APIRequester:
             str | None: The URL of the XLSX file if found, None if not found.
         """
         try:
-            ctx = ssl._create_unverified_context()
-            proxy_support = urllib.request.ProxyHandler({'http': PROXY,'https': PROXY})
-            opener = urllib.request.build_opener(proxy_support, urllib.request.HTTPSHandler(context=ctx))
-            urllib.request.install_opener(opener)
-
-            with urllib.request.urlopen(self.api_url_suspend_more_six_month) as response:
-                data = response.read()
-                data = data.decode('utf-8')
+            response = self.session.get(self.api_url_suspend_more_six_month, timeout=30)
+            response.raise_for_status()
+            data = response.text
 
             soup = BeautifulSoup(data, 'html.parser')
             link_tag = soup.find("a", href=lambda href: href and href.endswith(".xlsx"))
             if link_tag:
                 xlsx_url = 'https://www.idx.co.id' + link_tag.get('href')
-                LOGGER.info(f"Successfully found URL: {xlsx_url}")
+                LOGGER.info("Successfully found URL: %s", xlsx_url)
                 return xlsx_url
             else:
                 LOGGER.error("Error: Could not find the .xlsx link in the HTML.")
                 return None
             
         except Exception as error:
-            LOGGER.error(f"Error fetching the URL: {error}")
+            LOGGER.error("Error fetching the URL: %s", error)
             return ""
 
-    def fetch_xlsx_file(self) -> pd.DataFrame: 
-        """ 
-        Fetches the XLSX file from the IDX website and returns it as a pandas DataFrame.
+    def fetch_xlsx_file(self) -> bytes | None:
+        """
+        Fetches the XLSX file containing suspension data from the IDX website.
 
         Returns:
-            pd.DataFrame: The DataFrame containing the data from the XLSX file.
+            bytes | None: The raw content of the XLSX file, or None if the download fails.
         """
         xlsx_url = self.get_xlsx_url_proxy()
 
         if not xlsx_url:
-            LOGGER.warning("Failed to get XLSX URL. Returning empty DataFrame.")
-            return pd.DataFrame()
-        
-        max_retries = 3
-        timeout = 30
+            LOGGER.warning("Failed to get XLSX URL.")
+            return None
 
-        for attempt in range(max_retries):
-            try:
-                LOGGER.info('Downloading xlsx file')
-                # Download file as binary
-                with urllib.request.urlopen(xlsx_url, timeout=timeout) as response:
-                    file_bytes= response.read()
+        try:
+            LOGGER.info('Downloading xlsx file')
+            # Download file as binary, the session adapter retries transient errors
+            response = self.session.get(xlsx_url, timeout=30)
+            response.raise_for_status()
+            return response.content
 
-                df = pd.read_excel(BytesIO(file_bytes))
-                return df
-            
-            except Exception as error:
-                LOGGER.warning(f"Attempt {attempt + 1} failed: {error}") 
-                
-                if attempt < max_retries - 1:
-                    # Exponential backoff
-                    wait_time = (attempt + 1) * 2  
-                    LOGGER.info(f"Retrying in {wait_time} seconds...")
-                    time.sleep(wait_time)
-                else:
-                    LOGGER.error(f"All {max_retries} attempts failed. Returning empty DataFrame.")
-                    return pd.DataFrame()
-       
-        return pd.DataFrame()
\ No newline at end of file
+        except Exception as error:
+            LOGGER.error("Downloading xlsx file failed: %s", error)
+            return None
\ No newline at end of file
@@ -1,12 +1,123 @@
-from datetime   import datetime 
+from concurrent.futures import ProcessPoolExecutor
+from itertools          import repeat
+from io                 import BytesIO
 
 from setup          import LOGGER
 from .api_requester import APIRequester
 
 import pandas as pd
-import json  
-import re 
-import os 
+import openpyxl
+import orjson
+import logging
+import re
+import os
+import fitz
+
+
+# Maximum number of worker processes parsing downloaded pdfs
+MAX_PARSE_WORKERS = os.cpu_count() or 1
+
+# Precompiled patterns reused across every pdf
+DATE_RE = re.compile(r"(\d{1,2}\s+\w+\s+\d{4})", re.IGNORECASE)
+# Only match keyword -> date within 200 chars
+DATE_CTX_RE = re.compile(
+    r"(?:suspensi|penghentian\s+sementara).{0,200}?(?:tanggal\s+)?(?P<date>\d{1,2}\s+\w+\s+\d{4})",
+    re.IGNORECASE
+)
+DECISION_RE = re.compile(
+    r"Atas dasar hal tersebut di atas, Bursa memutuskan untuk:(.*)",
+    re.S | re.IGNORECASE
+)
+SECTION_A_RE = re.compile(r"a\.(.*?)(?=b\.)", re.S | re.IGNORECASE)
+SECTION_B_RE = re.compile(r"b\.(.*)", re.S | re.IGNORECASE)
+SYMBOL_RE = re.compile(r"\(([A-Z]{4})\)")
+FALLBACK_SYMBOL_RE = re.compile(r"\d+\.\s+([A-Z]{3,4})\b")
+WHITESPACE_RE = re.compile(r"\s+")
+
+# Indonesian month names and abbreviations mapped to month numbers
+MONTH_MAP = {
+    'januari': '01', 'jan': '01',
+    'februari': '02', 'feb': '02',
+    'maret': '03', 'mar': '03',
+    'april': '04', 'apr': '04',
+    'mei': '05',
+    'juni': '06', 'jun': '06',
+    'juli': '07', 'jul': '07',
+    'agustus': '08', 'agu': '08', 'agt': '08',
+    'september': '09', 'sep': '09', 'sept': '09',
+    'oktober': '10', 'okt': '10',
+    'november': '11', 'nov': '11',
+    'desember': '12', 'des': '12'
+}
+
+# Sorted longest-first so "september" matches before "sep"
+MONTH_RE = re.compile(
+    r"\b(" + "|".join(sorted(MONTH_MAP, key=len, reverse=True)) + r")\b",
+    re.IGNORECASE
+)
+
+# Reason search patterns mapped to message templates, {symbol} is filled in per stock.
+# Built once at module load so the matcher below is symbol-independent.
+REASON_PATTERNS = {
+    "peningkatan harga kumulatif yang signifikan":
+        "Terjadinya peningkatan harga kumulatif yang signifikan pada saham {symbol}",
+
+    "cooling down sebagai bentuk perlindungan bagi investor":
+        "Dalam rangka cooling down sebagai bentuk perlindungan bagi investor",
+
+    "untuk melakukan pembubaran dan likuidasi":
+        "Berencana untuk melakukan pembubaran dan likuidasi {symbol}",
+
+    "penurunan harga kumulatif yang signifikan":
+        "Terjadinya penurunan harga kumulatif yang signifikan pada saham {symbol}",
+
+    "perihal penundaan pembayaran pelunasan pokok & bunga mtn xv pp properti tahun 2022 ke-12 (ppro15xxmf)":
+        "Perihal Penundaan Pembayaran Pelunasan Pokok & Bunga MTN XV PP Properti Tahun 2022 Ke-12 (PPRO15XXMF)",
+
+    "belum menyampaikan laporan keuangan auditan tahunan":
+        "Belum menyampaikan laporan keuangan auditan tahunan",
+
+    "berada dalam papan pemantauan khusus selama lebih dari 1 (satu) tahun berturut-turut":
+        "Efek Perseroan telah berada dalam papan pemantauan khusus selama lebih dari 1 (satu) tahun berturut-turut",
+
+    "pengalihan saham hasil pelaksanaan pembelian kembali saham":
+        "Dalam rangka pengalihan saham hasil pelaksanaan pembelian kembali saham (buyback) dalam rangka delisting perseroan",
+
+    "belum menyampaikan laporan keuangan interim per 31 maret 2025":
+        "Belum menyampaikan laporan keuangan interim per 31 maret 2025 dan/atau belum melakukan pembayaran denda atas "
+        "keterlambatan penyampaian laporan keuangan tersebut",
+
+    "belum memenuhi ketentuan v.1.1.":
+        "Belum memenuhi ketentuan V.1.1. dan/atau V.1.2. peraturan bursa nomor I-A",
+
+    "keterlambatan pembayaran biaya pencatatan tahunan 2025":
+        "Keterlambatan pembayaran biaya pencatatan tahunan 2025",
+
+    "terdapat keraguan atas kelangsungan usaha perseroan":
+        "Bursa menilai bahwa terdapat keraguan atas kelangsungan usaha perseroan",
+
+    "adanya ketidakpastian atas kelangsungan usaha":
+        "Sehubungan dengan adanya ketidakpastian atas kelangsungan usaha",
+
+    "perseroan akan melakukan tindakan korporasi berupa penggabungan usaha":
+        "Perseroan akan melakukan tindakan korporasi berupa penggabungan usaha yang akan mengakibatkan saham Perseroan "
+        "menjadi tidak tercatat di Bursa",
+
+    "terdapat rencana perubahan status perseroan dari perusahaan terbuka menjadi perusahaan tertutup":
+        "Terdapat rencana perubahan status Perseroan dari Perusahaan Terbuka menjadi Perusahaan Tertutup (Go Private) "
+        "dan rencana voluntary delisting saham Perseroan di Bursa Efek Indonesia.",
+
+    "menunda pembayaran amortisasi pokok ke-12 dan bunga ke-24 dari obligasi i kapuas prima coal":
+        "Perseroan telah menunda pembayaran amortisasi pokok ke-12 dan bunga ke-24 dari Obligasi I Kapuas Prima Coal Tahun 2018 (ZINC01E) "
+        "yang seharusnya efektif dibayarkan pada tanggal 13 Februari 2025",
+
+    "menunda pembayaran pokok sukuk mudharabah berkelanjutan":
+        "Perseroan telah menunda pembayaran pokok Sukuk Mudharabah Berkelanjutan II Wijaya Karya Tahap II  Tahun 2022 Seri A (SMWIKA02ACN2) "
+        "dan Obligasi Berkelanjutan II Wijaya Karya Tahap II Tahun 2022 Seri A (WIKA02ACN2)"
+}
+
+# Single alternation so one scan over the text finds any reason pattern
+REASON_RE = re.compile("|".join(re.escape(pattern) for pattern in REASON_PATTERNS))
 
 
 def prepare_df_suspend_six_month(requester: APIRequester) -> pd.DataFrame:
@@ -19,40 +130,76 @@ def prepare_df_suspend_six_month(requester: APIRequester) -> pd.DataFrame:
     Returns:
         pd.DataFrame: A DataFrame with columns 'Kode' and 'Tanggal Suspensi'.
     """
-    df = requester.fetch_xlsx_file() 
-    df = df[['Kode', "Tanggal Suspensi"]].copy()
+    raw_bytes = requester.fetch_xlsx_file()
+
+    if not raw_bytes:
+        LOGGER.warning("Failed to download suspension xlsx. Returning empty DataFrame.")
+        return pd.DataFrame(columns=['Kode', 'Tanggal Suspensi'])
+
+    # Stream rows instead of materializing the whole workbook
+    workbook = openpyxl.load_workbook(BytesIO(raw_bytes), read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows)
+        index_kode = header.index('Kode')
+        index_tanggal = header.index('Tanggal Suspensi')
+        data = [(row[index_kode], row[index_tanggal]) for row in rows if row[index_kode]]
+    finally:
+        workbook.close()
+
+    df = pd.DataFrame(data, columns=['Kode', 'Tanggal Suspensi'])
     df['Tanggal Suspensi'] = pd.to_datetime(df['Tanggal Suspensi']).dt.strftime('%Y-%m-%d')
-    return df 
+    return df
 
 
-def get_pdf_texts(requester: APIRequester, pdf_url: str) -> str:
-    """ 
-    Fetches the PDF file from the given URL and extracts its text content.
+def iter_pdf_pages(pdf_bytes: bytes):
+    """
+    Opens a PDF document from raw bytes and yields the text of each page.
 
     Args:
-        requester (APIRequester): An instance of APIRequester to handle the request.
-        pdf_url (str): The URL of the PDF file to fetch.
-    
-    Returns:
-        str: The text content of the PDF file.
-    """
-    pdf_doc = requester.fetch_pdf_file(pdf_url)
+        pdf_bytes (bytes): The raw content of the PDF file.
 
-    full_pdf_doc = ""
+    Yields:
+        str: The text content of one page at a time.
+    """
+    pdf_doc = None
     try:
-        # Loop length pdf page
-        for page_num in range(len(pdf_doc)):
-            page = pdf_doc[page_num]
-            text = page.get_text()
-            full_pdf_doc+=text
+        pdf_doc = fitz.open(stream=pdf_bytes, filetype="pdf")
+        for page in pdf_doc:
+            yield page.get_text("text")
     except Exception as error:
-        LOGGER.error(f'Error getting pdf texts {error}')
-    
+        LOGGER.error('Error getting pdf texts %s', error)
+
     finally:
         if pdf_doc:
             pdf_doc.close()
-    
-    return full_pdf_doc
+
+
+def get_pdf_texts(pdf_bytes: bytes) -> str:
+    """
+    Opens a PDF document from raw bytes and extracts its text content.
+
+    Args:
+        pdf_bytes (bytes): The raw content of the PDF file.
+
+    Returns:
+        str: The text content of the PDF file.
+    """
+    # Collect per-page text and join once at the end
+    return "".join(iter_pdf_pages(pdf_bytes))
+
+
+def normalize_spaces(text: str) -> str:
+    """
+    Collapses all whitespace in the text to single spaces.
+
+    Args:
+        text (str): The raw text to normalize.
+
+    Returns:
+        str: The whitespace-normalized text.
+    """
+    return " ".join(text.split())
 
 
 def get_date_from_pdf(full_pdf_doc: str) -> str | None:
@@ -60,24 +207,18 @@ def get_date_from_pdf(full_pdf_doc: str) -> str | None:
     Extracts the suspension date from the PDF document text based on specific patterns.
 
     Args:
-        full_pdf_doc (str): The text content of the PDF document.
+        full_pdf_doc (str): The whitespace-normalized text content of the PDF document.
     
     Returns:
         str | None: The extracted suspension date in 'YYYY-MM-DD' format, or None.
     """
-    text = " ".join(full_pdf_doc.split())
-    date_pattern = r"(\d{1,2}\s+\w+\s+\d{4})"
-    keywords = ["suspensi", "penghentian\s+sementara"]
+    text = full_pdf_doc
 
     all_candidates = []
 
-    for kw in keywords:
-        # Only match keyword -> date within 200 chars
-        pattern_after = rf"{kw}.{{0,200}}?(?:tanggal\s+)?{date_pattern}"
-        matches = re.finditer(pattern_after, text, re.IGNORECASE)
-        for m in matches:
-            snippet = text[m.start():m.end()]
-            all_candidates.append((m.group(1), snippet.lower()))
+    for m in DATE_CTX_RE.finditer(text):
+        snippet = text[m.start():m.end()]
+        all_candidates.append((m.group('date'), snippet.lower()))
 
     # Try to matches that mention 'sesi ii' first
     sesi_matches = [date for date, snippet in all_candidates if "sesi ii" in snippet]
@@ -96,89 +237,31 @@ def get_reason(full_pdf_doc: str, symbol: str) -> str | None:
     Extract suspension reason from PDF document text based on predefined patterns.
     
     Args:
-        full_pdf_doc: Raw PDF document text
+        full_pdf_doc: Whitespace-normalized PDF document text
         symbol: Stock symbol for personalized messages
         
     Returns:
         Formatted reason string or None if no match found
     """
-    # Normalize spacing and lowercase for consistent matching
-    pdf_texts = " ".join(full_pdf_doc.split())
-    pdf_texts_lower = pdf_texts.lower()
-    
-    # Define reason pattern, format: {search_pattern: formatted_message_to_return}
-    reason_patterns = {
-        "peningkatan harga kumulatif yang signifikan": 
-            f"Terjadinya peningkatan harga kumulatif yang signifikan pada saham {symbol}",
-        
-        "cooling down sebagai bentuk perlindungan bagi investor":
-            "Dalam rangka cooling down sebagai bentuk perlindungan bagi investor",
-        
-        "untuk melakukan pembubaran dan likuidasi":
-            f"Berencana untuk melakukan pembubaran dan likuidasi {symbol}",
-        
-        "penurunan harga kumulatif yang signifikan":
-            f"Terjadinya penurunan harga kumulatif yang signifikan pada saham {symbol}",
-        
-        "perihal penundaan pembayaran pelunasan pokok & bunga mtn xv pp properti tahun 2022 ke-12 (ppro15xxmf)":
-            "Perihal Penundaan Pembayaran Pelunasan Pokok & Bunga MTN XV PP Properti Tahun 2022 Ke-12 (PPRO15XXMF)",
-        
-        "belum menyampaikan laporan keuangan auditan tahunan":
-            "Belum menyampaikan laporan keuangan auditan tahunan",
-        
-        "berada dalam papan pemantauan khusus selama lebih dari 1 (satu) tahun berturut-turut":
-            "Efek Perseroan telah berada dalam papan pemantauan khusus selama lebih dari 1 (satu) tahun berturut-turut",
-        
-        "pengalihan saham hasil pelaksanaan pembelian kembali saham":
-            "Dalam rangka pengalihan saham hasil pelaksanaan pembelian kembali saham (buyback) dalam rangka delisting perseroan",
-        
-        "belum menyampaikan laporan keuangan interim per 31 maret 2025":
-            "Belum menyampaikan laporan keuangan interim per 31 maret 2025 dan/atau belum melakukan pembayaran denda atas "
-            "keterlambatan penyampaian laporan keuangan tersebut",
-        
-        "belum memenuhi ketentuan v.1.1.":
-            "Belum memenuhi ketentuan V.1.1. dan/atau V.1.2. peraturan bursa nomor I-A",
-        
-        "keterlambatan pembayaran biaya pencatatan tahunan 2025":
-            "Keterlambatan pembayaran biaya pencatatan tahunan 2025",
-        
-        "terdapat keraguan atas kelangsungan usaha perseroan":
-            "Bursa menilai bahwa terdapat keraguan atas kelangsungan usaha perseroan",
-        
-        "adanya ketidakpastian atas kelangsungan usaha":
-            "Sehubungan dengan adanya ketidakpastian atas kelangsungan usaha",
-        
-        "perseroan akan melakukan tindakan korporasi berupa penggabungan usaha":
-            "Perseroan akan melakukan tindakan korporasi berupa penggabungan usaha yang akan mengakibatkan saham Perseroan "
-            "menjadi tidak tercatat di Bursa",
-        
-        "terdapat rencana perubahan status perseroan dari perusahaan terbuka menjadi perusahaan tertutup":
-            "Terdapat rencana perubahan status Perseroan dari Perusahaan Terbuka menjadi Perusahaan Tertutup (Go Private) "
-            "dan rencana voluntary delisting saham Perseroan di Bursa Efek Indonesia.",
-        
-        "menunda pembayaran amortisasi pokok ke-12 dan bunga ke-24 dari obligasi i kapuas prima coal":
-            "Perseroan telah menunda pembayaran amortisasi pokok ke-12 dan bunga ke-24 dari Obligasi I Kapuas Prima Coal Tahun 2018 (ZINC01E) "
-            "yang seharusnya efektif dibayarkan pada tanggal 13 Februari 2025",
-        
-        "menunda pembayaran pokok sukuk mudharabah berkelanjutan":
-            "Perseroan telah menunda pembayaran pokok Sukuk Mudharabah Berkelanjutan II Wijaya Karya Tahap II  Tahun 2022 Seri A (SMWIKA02ACN2) "
-            "dan Obligasi Berkelanjutan II Wijaya Karya Tahap II Tahun 2022 Seri A (WIKA02ACN2)"
-    }
+    # Lowercase for consistent matching
+    pdf_texts_lower = full_pdf_doc.lower()
     
+    # Collect every matching pattern in one scan over the text
+    hits = set(REASON_RE.findall(pdf_texts_lower))
+
     # Special case Combined conditions
-    has_price_increase = "peningkatan harga kumulatif yang signifikan" in pdf_texts_lower
-    has_cooling_down = "cooling down sebagai bentuk perlindungan bagi investor" in pdf_texts_lower
-    
-    if has_price_increase and has_cooling_down:
+    if {"peningkatan harga kumulatif yang signifikan",
+        "cooling down sebagai bentuk perlindungan bagi investor"} <= hits:
         return (
             f"Terjadinya peningkatan harga kumulatif yang signifikan pada saham {symbol}, "
             f"dalam rangka cooling down sebagai bentuk perlindungan bagi investor"
         )
-    
-    for pattern, message in reason_patterns.items():
-        if pattern in pdf_texts_lower:
-            return message
-    
+
+    # Resolve in declaration order so earlier patterns keep priority
+    for pattern, message in REASON_PATTERNS.items():
+        if pattern in hits:
+            return message.format(symbol=symbol)
+
     return None
 
 
@@ -188,7 +271,7 @@ def process_multiple_data_from_pdf(full_pdf_doc: str, symbol: str,
     Processes a PDF document containing multiple suspension data for a given stock symbol.
 
     Args:
-        full_pdf_doc (str): The text content of the PDF document.
+        full_pdf_doc (str): The whitespace-normalized text content of the PDF document.
         symbol (str): The stock symbol for which the data is being processed.
         pdf_url (str): The URL of the PDF file.
         root_pdf_url (str): The root URL for constructing the full PDF URL.
@@ -196,42 +279,35 @@ def process_multiple_data_from_pdf(full_pdf_doc: str, symbol: str,
     Returns:
         list[dict[str]]: A list of dictionaries containing the processed suspension data.
     """
-    text = " ".join(full_pdf_doc.split())
+    text = full_pdf_doc
 
     results = []
 
     # Get reason
     reason = get_reason(text, symbol)
 
-    decision_match = re.search(
-        r"Atas dasar hal tersebut di atas, Bursa memutuskan untuk:(.*)",
-        text,
-        flags=re.S | re.I
-    )
+    decision_match = DECISION_RE.search(text)
 
     # Work with only the decision section if found
     decision_text = decision_match.group(1) if decision_match else text
-    LOGGER.info(f"decision text {decision_text}")
+    LOGGER.debug("decision text %s", decision_text)
 
     # Split by "a." an  d "b."
-    section_a_match = re.search(r"a\.(.*?)(?=b\.)", decision_text, flags=re.S | re.I)
-    section_b_match = re.search(r"b\.(.*)", decision_text, flags=re.S | re.I)
-    
-    LOGGER.info(f"section_a {section_a_match}")
+    section_a_match = SECTION_A_RE.search(decision_text)
+    section_b_match = SECTION_B_RE.search(decision_text)
 
-    # Date pattern
-    date_pattern = r"(\d{1,2}\s+\w+\s+\d{4})"
-    
-    # Process Section A 
+    LOGGER.debug("section_a %s", section_a_match)
+
+    # Process Section A
     if section_a_match:
         section_a = section_a_match.group(1)
 
         # Find date in section A
-        date_match = re.search(date_pattern, section_a, flags=re.I)
+        date_match = DATE_RE.search(section_a)
         suspend_date = date_match.group(1) if date_match else None
 
         # Find symbols in parentheses
-        symbols = re.findall(r"\(([A-Z]{4})\)", section_a)
+        symbols = SYMBOL_RE.findall(section_a)
         for sym in symbols:
             results.append({
                 "symbol": f"{sym}.JK", 
@@ -244,7 +320,7 @@ def process_multiple_data_from_pdf(full_pdf_doc: str, symbol: str,
     if section_b_match:
         section_b = section_b_match.group(1)
         # Find symbols in parentheses
-        symbols = re.findall(r"\(([A-Z]{4})\)", section_b)
+        symbols = SYMBOL_RE.findall(section_b)
         for sym in symbols:
             results.append({
                 "symbol": f"{sym}.JK", 
@@ -255,7 +331,7 @@ def process_multiple_data_from_pdf(full_pdf_doc: str, symbol: str,
 
     # Fallback if section a and b not appear
     if not section_a_match and not section_b_match:
-        symbols = re.findall(r"\d+\.\s+([A-Z]{3,4})\b", text)
+        symbols = FALLBACK_SYMBOL_RE.findall(text)
         suspend_date = get_date_from_pdf(text)
         for sym in symbols:
             results.append({
@@ -268,80 +344,65 @@ def process_multiple_data_from_pdf(full_pdf_doc: str, symbol: str,
     return results
 
 
-def check_suspend_six_month(df_payload: pd.DataFrame, requester: APIRequester) -> pd.DataFrame:
+def check_suspend_six_month(final_payload: list[dict[str]], requester: APIRequester) -> list[dict[str]]:
     """ 
     Checks if any symbols in the payload are suspended for more than six months
 
     Args:
-        df_payload (pd.DataFrame): The DataFrame containing suspension data.
+        final_payload (list[dict[str]]): The payload rows extracted from the announcements.
         requester (APIRequester): An instance of APIRequester to fetch the suspension data.
     
     Returns:
-        pd.DataFrame: The updated DataFrame with suspension reasons and dates for symbols suspended for more
+        list[dict[str]]: The payload rows with reason and date overridden for six-month suspensions.
     """
     df_suspend_six_month = prepare_df_suspend_six_month(requester)
-    df_suspend_six_month['Kode'] = df_suspend_six_month['Kode'].apply(lambda x: x + '.JK')
-    suspend_dict = df_suspend_six_month.set_index('Kode')['Tanggal Suspensi'].to_dict()
 
-    LOGGER.info(f"Check data suspend six month: \n{df_suspend_six_month.head(2)}")
+    LOGGER.debug("Check data suspend six month: \n%s", df_suspend_six_month.head(2))
 
-    mask = df_payload['symbol'].isin(df_suspend_six_month['Kode'])
+    # Plain dict lookup, the daily payload is small enough that pandas overhead dominates
+    suspend_dict = {
+        kode + '.JK': tanggal
+        for kode, tanggal in zip(df_suspend_six_month['Kode'], df_suspend_six_month['Tanggal Suspensi'])
+    }
 
-    LOGGER.info(f"Matched count suspend six month: {mask.sum()}")
+    matched_count = 0
+    for item in final_payload:
+        suspend_date = suspend_dict.get(item['symbol'])
+        if suspend_date is not None:
+            item['reason'] = "Suspend more than 6 month"
+            item['suspension_date'] = suspend_date
+            matched_count += 1
 
-    df_payload.loc[mask, 'reason'] = "Suspend more than 6 month"
-    df_payload.loc[mask, 'suspension_date'] = df_payload.loc[mask, 'symbol'].map(suspend_dict)
+    LOGGER.info("Matched count suspend six month: %s", matched_count)
 
-    return df_payload
+    return final_payload
 
 
-def parse_mixed_date(date_str: str) -> str | None:
-    """ 
-    Parses a date string that may contain mixed formats, including Indonesian month names.
+def parse_mixed_date_column(date_series: pd.Series) -> pd.Series:
+    """
+    Parses a Series of date strings that may contain mixed formats, including
+    Indonesian month names, using vectorized string operations.
 
     Args:
-        date_str (str): The date string to parse
-    
+        date_series (pd.Series): The Series of date strings to parse.
+
     Returns:
-        str | None: The parsed date in 'YYYY-MM-DD' format, or None if parsing fails
+        pd.Series: The parsed dates in 'YYYY-MM-DD' format, with None where parsing fails.
     """
-    month_map = {
-        'januari': '01', 'jan': '01',
-        'februari': '02', 'feb': '02',
-        'maret': '03', 'mar': '03',
-        'april': '04', 'apr': '04',
-        'mei': '05',
-        'juni': '06', 'jun': '06',
-        'juli': '07', 'jul': '07',
-        'agustus': '08', 'agu': '08', 'agt': '08',
-        'september': '09', 'sep': '09', 'sept': '09',
-        'oktober': '10', 'okt': '10',
-        'november': '11', 'nov': '11',
-        'desember': '12', 'des': '12'
-    }
-    
-    # Try direct parse (for YYYY-MM-DD and datetimes)
-    try:
-        return pd.to_datetime(date_str, errors='raise').date()
-    except:
-        pass
+    cleaned = date_series.astype(str).str.strip().str.lower()
+    # Replace month names in a single pass and normalize spaces
+    cleaned = cleaned.str.replace(MONTH_RE, lambda m: MONTH_MAP[m.group(1)], regex=True)
+    cleaned = cleaned.str.replace(WHITESPACE_RE, " ", regex=True)
 
-    # Lowercase for matching
-    date_str = str(date_str).strip().lower()
-    
-    # Replace month names
-    for month_name, month_num in month_map.items():
-        date_str = re.sub(rf"\b{month_name}\b", month_num, date_str)
+    parsed = pd.to_datetime(cleaned, format="%d %m %Y", errors="coerce")
+    # Fallback for values already in YYYY-MM-DD or datetime formats
+    parsed = parsed.fillna(pd.to_datetime(date_series, errors="coerce"))
 
-    # Normalize spaces
-    clean_date = re.sub(r"\s+", " ", date_str)
+    failed = parsed.isna()
+    if failed.any():
+        LOGGER.error("Failed to parse dates: %s", date_series[failed].unique().tolist())
 
-    try:
-        parsed_date = datetime.strptime(clean_date, "%d %m %Y").date()
-        return parsed_date.strftime("%Y-%m-%d")
-    except Exception as error:
-        LOGGER.error(f"Failed to parse date '{clean_date}': {error}")
-        return None
+    return parsed.dt.strftime("%Y-%m-%d").where(~failed, None)
 
 
 def process_incomplete_data(df_missing: pd.DataFrame, file_name: str):
@@ -362,13 +423,15 @@ def process_incomplete_data(df_missing: pd.DataFrame, file_name: str):
             
             combined_missing.to_csv(file_name, index=False)
             new_rows = len(combined_missing) - len(existing_missing)
-            LOGGER.info(f"Added {new_rows} new missing data rows (total: {len(combined_missing)} rows)")
+            LOGGER.info("Added %s new missing data rows (total: %s rows)", new_rows, len(combined_missing))
         except Exception as error:
-            LOGGER.warning(f"Could not read existing missing data file: {error} Appending new dataa")
+            LOGGER.warning("Could not read existing missing data file: %s Appending new data", error)
+            # File exists but is unreadable, append without repeating the header
+            df_missing.to_csv(file_name, mode="a", header=False, index=False)
     else:
         # File doesn't exist, create new one
         df_missing.to_csv(file_name, index=False)
-        LOGGER.info(f"Missing data saved to {file_name} with {len(df_missing)} rows")
+        LOGGER.info("Missing data saved to %s with %s rows", file_name, len(df_missing))
 
 
 def clean_dataframe_payload(df: pd.DataFrame) -> pd.DataFrame:
@@ -391,31 +454,115 @@ def clean_dataframe_payload(df: pd.DataFrame) -> pd.DataFrame:
     if len(df_missing) > 0:
         process_incomplete_data(df_missing, file_name)
 
-    # Only write headers if file doesn't exist
-    write_header = not os.path.exists(file_name)
-    df_missing.to_csv(file_name, mode="a", header=write_header, index=False)
-    LOGGER.info(f"Missing data saved to data_incomplete/idx_suspension_missing_data.csv with {len(df_missing)} rows")
-
     df_clean = df.dropna(subset=['suspension_date', 'reason']).copy()
     df_clean['suspension_date'] = (
-        df_clean['suspension_date']
-        .apply(parse_mixed_date)
-        .astype(str)  
+        parse_mixed_date_column(df_clean['suspension_date'])
+        .astype(str)
     )
-    LOGGER.info(f"df after parse date: {df_clean['suspension_date'].head()}")
+    LOGGER.debug("df after parse date: %s", df_clean['suspension_date'].head())
 
     df_clean = df_clean.drop_duplicates(subset=['symbol', 'suspension_date'])
-    LOGGER.info(f"Data after removing missing values and Duplicate: {len(df_clean)} rows")
+    LOGGER.info("Data after removing missing values and Duplicate: %s rows", len(df_clean))
     return df_clean
 
 
-def run_get_idx_suspension(allowed_symbols: list[str], requester: APIRequester) -> pd.DataFrame | list:
+def process_suspension_data(data: dict, pdf_bytes: bytes | None,
+                            allowed_symbols: frozenset[str], root_pdf_url: str) -> list[dict[str]]:
+    """
+    Processes a single suspension announcement into payload rows.
+
+    Args:
+        data (dict): One announcement entry from the IDX API results.
+        pdf_bytes (bytes | None): The downloaded pdf content, or None if the download failed.
+        allowed_symbols (frozenset[str]): Set of allowed stock symbols to filter the results.
+        root_pdf_url (str): The root URL for constructing the full PDF URL.
+
+    Returns:
+        list[dict[str]]: The payload rows extracted from the announcement, empty on skip or error.
+    """
+    try:
+        # Get pdf url
+        pdf_url = data.get('Data_Download')
+
+        if pdf_bytes is None:
+            LOGGER.warning("Skipping %s: pdf download failed for %s", data.get('Kode'), pdf_url)
+            return []
+
+        # Check if multiple symbols
+        title = data.get('Judul')
+
+        if "(\u003E1 kode)" in title.lower() or ">1 kode" in title.lower():
+            symbol = data.get('Kode')
+            LOGGER.info("Process multiple data %s", symbol)
+
+            # Multiple announcements need the whole document, normalized once here
+            pdf_texts = normalize_spaces(get_pdf_texts(pdf_bytes))
+
+            # Process multiple
+            multiple_data = process_multiple_data_from_pdf(pdf_texts, symbol, pdf_url, root_pdf_url)
+
+            # Filter out symbols not in allowed_symbols
+            filtered_data = [
+                item for item in multiple_data
+                if item.get('symbol') in allowed_symbols
+            ]
+
+            if not filtered_data:
+                LOGGER.info("No allowed symbols found in multiple data")
+            return filtered_data
+
+        else:
+            # Get symbol and validate
+            symbol = data.get('Kode')
+            symbol = f"{symbol}.JK"
+            if symbol not in allowed_symbols:
+                LOGGER.warning("Symbol %s not in allowed symbols, skipping", symbol)
+                return []
+
+            LOGGER.info("Process single data %s", symbol)
+
+            # Collect pages lazily, checking only each new page, and stop
+            # once both a date candidate and a reason pattern have appeared
+            pages = []
+            has_date = False
+            has_reason = False
+            for page_text in iter_pdf_pages(pdf_bytes):
+                pages.append(page_text)
+                page_norm = normalize_spaces(page_text).lower()
+                has_date = has_date or DATE_CTX_RE.search(page_norm) is not None
+                has_reason = has_reason or REASON_RE.search(page_norm) is not None
+                if has_date and has_reason:
+                    break
+
+            # Run the full extractors once over the collected text
+            pdf_texts = normalize_spaces("".join(pages))
+            # Get date from pdf
+            date = get_date_from_pdf(pdf_texts)
+            # Get reason from pdf
+            reason = get_reason(pdf_texts, symbol)
+
+            return [
+                {
+                    "symbol": symbol,
+                    'pdf_url': root_pdf_url + pdf_url,
+                    'suspension_date': date,
+                    'reason': reason
+                }
+            ]
+
+    except Exception as error:
+        symbol_for_error = data.get('Kode', 'UNKNOWN')
+        LOGGER.error("A critical error occurred while processing symbol %s: %s", symbol_for_error, error)
+        return []
+
+
+def run_get_idx_suspension(allowed_symbols: frozenset[str], requester: APIRequester) -> pd.DataFrame | list:
     """
     Main function to run the IDX suspension scraper.
     Processes the suspension data for allowed symbols and returns a DataFrame.
 
     Args:
-        allowed_symbols (list[str]): List of allowed stock symbols to filter the results.  
+        allowed_symbols (frozenset[str]): Set of allowed stock symbols to filter the results.
         requester (APIRequester): An instance of APIRequester to handle API requests.
     
     Returns:
@@ -428,80 +575,44 @@ def run_get_idx_suspension(allowed_symbols: list[str], requester: APIRequester)
     if response == False:
         LOGGER.warning("Error accesing api url.") 
     
-    datas = json.loads(response)
+    datas = orjson.loads(response)
 
     data_results = datas.get('Results')
-    LOGGER.info(f'Length data need to process: {len(data_results)}')
-
-    for data in data_results:
-        try:    
-            # Get pdf url
-            pdf_url = data.get('Data_Download')
-
-            # Get full pdf text
-            pdf_texts = get_pdf_texts(requester, pdf_url)
-            
-            # Check if multiple symbols
-            title = data.get('Judul')
-
-            if "(\u003E1 kode)" in title.lower() or ">1 kode" in title.lower():
-                symbol = data.get('Kode')
-                LOGGER.info(f"Process multiple data {symbol}")
-
-                # Process multiple
-                multiple_data = process_multiple_data_from_pdf(pdf_texts, symbol, pdf_url, root_pdf_url)
-
-                # Filter out symbols not in allowed_symbols
-                filtered_data = [
-                    item for item in multiple_data 
-                    if item.get('symbol') in allowed_symbols
-                ]
-
-                if filtered_data:  
-                    final_payload.extend(filtered_data)
-                else:
-                    LOGGER.info(f"No allowed symbols found in multiple data")
-            else: 
-                # Get symbol and validate
-                symbol = data.get('Kode')
-                symbol = f"{symbol}.JK"
-                if symbol not in allowed_symbols:
-                    LOGGER.warning(f"Symbol {symbol} not in allowed symbols, skipping")
-                    continue
-
-                LOGGER.info(f"Process single data {symbol}")
-                # Get date from pdf 
-                date = get_date_from_pdf(pdf_texts)
-                # Get reason from pdf
-                reason = get_reason(pdf_texts, symbol)
-
-                final_payload.append(
-                    {
-                        "symbol": symbol,
-                        'pdf_url': root_pdf_url + pdf_url,
-                        'suspension_date': date,
-                        'reason': reason
-                    }
-                )
+    LOGGER.info('Length data need to process: %s', len(data_results))
+
+    # Download every pdf concurrently before parsing
+    pdf_urls = [data.get('Data_Download') for data in data_results]
+    pdf_bytes_results = requester.fetch_all_pdf_bytes(pdf_urls)
+
+    # Parse the downloaded pdfs in worker processes so text extraction
+    # and regex matching run outside the GIL entirely
+    with ProcessPoolExecutor(max_workers=MAX_PARSE_WORKERS) as executor:
+        results = executor.map(
+            process_suspension_data,
+            data_results,
+            pdf_bytes_results,
+            repeat(allowed_symbols),
+            repeat(root_pdf_url)
+        )
+        for result in results:
+            final_payload.extend(result)
 
-        except Exception as error:
-            symbol_for_error = data.get('Kode', 'UNKNOWN')
-            LOGGER.error(f"A critical error occurred while processing symbol {symbol_for_error}: {error}")
-            continue
-    
-    LOGGER.info(f"Check final payload: {final_payload[:5]}")
-    LOGGER.info(f"Successfully processed and found dates for {len(final_payload)} items.")
+    LOGGER.debug("Check final payload: %s", final_payload[:5])
+    LOGGER.info("Successfully processed and found dates for %s items.", len(final_payload))
     
     if not final_payload:
-        LOGGER.info(f"final payload is empty: {final_payload}, terminating the rest process")
+        LOGGER.info("final payload is empty, terminating the rest process")
         return final_payload
 
-    df_payload = pd.DataFrame(final_payload)
-    # Check dataframe suspend six month
-    df_payload = check_suspend_six_month(df_payload, requester)
+    # Check payload suspend six month while it is still a plain list
+    final_payload = check_suspend_six_month(final_payload, requester)
 
-    check_payload = df_payload.to_json(orient="records")
-    LOGGER.info(check_payload)
+    # Serializing the whole payload is only worth it when debugging
+    if LOGGER.isEnabledFor(logging.DEBUG):
+        LOGGER.debug(orjson.dumps(final_payload).decode())
+
+    # The DataFrame is only built here, for the cleaning / missing-data stage
+    df_payload = pd.DataFrame(final_payload)
 
     # Drop missing values and saved dataframe that has missing values as csv
     df_final_payload = clean_dataframe_payload(df_payload)